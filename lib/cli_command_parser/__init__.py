@@ -4,6 +4,8 @@ Command Parser
 :author: Doug Skrypa
 """
 
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
 from .config import (
     CommandConfig,
     ShowDefaults,
@@ -32,7 +34,6 @@ from .exceptions import (
     AmbiguousParseTree,
 )
 from .error_handling import ErrorHandler, error_handler, no_exit_handler, extended_error_handler
-from .formatting.commands import get_formatter
 from .nargs import REMAINDER
 from .parameters import (
     Parameter,
@@ -53,3 +54,33 @@ from .parameters import (
     TriFlag,
 )
 from .typing import Param, ParamOrGroup
+
+# fmt: off
+__all__ = [
+    'CommandConfig', 'ShowDefaults', 'OptionNameMode', 'SubcommandAliasHelpMode', 'AmbiguousComboMode',
+    'AllowLeadingDash',
+    'Command', 'AsyncCommand', 'main',
+    'Context', 'get_current_context', 'ctx', 'get_parsed', 'get_context', 'get_raw_arg',
+    'CommandParserException', 'CommandDefinitionError', 'ParameterDefinitionError', 'UsageError', 'ParamUsageError',
+    'BadArgument', 'InvalidChoice', 'MissingArgument', 'TooManyArguments', 'NoSuchOption', 'ParserExit',
+    'ParamConflict', 'ParamsMissing', 'NoActiveContext', 'AmbiguousParseTree',
+    'ErrorHandler', 'error_handler', 'no_exit_handler', 'extended_error_handler',
+    'get_formatter',
+    'REMAINDER',
+    'Parameter', 'PassThru', 'BasePositional', 'Positional', 'SubCommand', 'Action', 'BaseOption', 'Option', 'Flag',
+    'Counter', 'ActionFlag', 'action_flag', 'before_main', 'after_main', 'ParamGroup', 'TriFlag',
+    'Param', 'ParamOrGroup',
+]
+# fmt: on
+
+if _TYPE_CHECKING:
+    from .formatting.commands import get_formatter
+
+
+def __getattr__(name: str):
+    # Help text formatting is only needed when help/usage is actually rendered, so loading it is deferred until then
+    if name == 'get_formatter':
+        from .formatting.commands import get_formatter
+
+        return get_formatter
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
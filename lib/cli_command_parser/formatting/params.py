@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from functools import cached_property
 from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Type
+from weakref import WeakKeyDictionary
 
 from ..config import CmdAliasMode, SubcommandAliasHelpMode
 from ..context import ctx
@@ -30,12 +31,16 @@ if TYPE_CHECKING:
 class ParamHelpFormatter:
     __slots__ = ('param',)
     _param_cls_fmt_cls_map = {}
+    # Results of the MRO-based lookups for param classes that were not registered.  Weak keys allow locally defined
+    # Parameter subclasses (common in tests) to be garbage collected.
+    _inherited_fmt_cls_cache = WeakKeyDictionary()
     required_formatter_map: BoolFormatterMap = {False: '[{}]'.format}
 
     def __init_subclass__(cls, param_cls: Type[ParamOrGroup] = None, **kwargs):
         super().__init_subclass__(**kwargs)
         if param_cls is not None:
             cls._param_cls_fmt_cls_map[param_cls] = cls
+            cls._inherited_fmt_cls_cache.clear()  # A new registration may change the best match for any subclass
 
     @classmethod
     def for_param_cls(cls, param_cls: Type[ParamOrGroup]):
@@ -43,12 +48,17 @@ class ParamHelpFormatter:
             return cls._param_cls_fmt_cls_map[param_cls]
         except KeyError:
             pass
+        try:
+            return cls._inherited_fmt_cls_cache[param_cls]
+        except KeyError:
+            pass
 
-        for p_cls, f_cls in reversed(cls._param_cls_fmt_cls_map.items()):
-            if issubclass(param_cls, p_cls):
-                return f_cls
-
-        return ParamHelpFormatter
+        fmt_cls = next(
+            (f_cls for p_cls, f_cls in reversed(cls._param_cls_fmt_cls_map.items()) if issubclass(param_cls, p_cls)),
+            ParamHelpFormatter,
+        )
+        cls._inherited_fmt_cls_cache[param_cls] = fmt_cls
+        return fmt_cls
 
     def __new__(cls, param: ParamOrGroup):
         return super().__new__(cls.for_param_cls(param.__class__) if cls is ParamHelpFormatter else cls)
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import typing as _t
 from enum import Enum as _Enum
+from re import Pattern as _Pattern
 
 from ..exceptions import ParameterDefinitionError as _ParameterDefinitionError
 from .exceptions import InputValidationError, InvalidChoiceError
@@ -33,8 +34,9 @@ __all__ = [
 ]
 # fmt: on
 
-_INVALID_CHOICES_TYPES = (_t.Pattern, InputType)
-_INVALID_TYPES_WITH_CHOICES = (Range, range, Regex, _t.Pattern, Glob)
+# Note: re.Pattern is used instead of typing.Pattern since isinstance checks against the typing alias are ~10x slower
+_INVALID_CHOICES_TYPES = (_Pattern, InputType)
+_INVALID_TYPES_WITH_CHOICES = (Range, range, Regex, _Pattern, Glob)
 
 
 def normalize_input_type(type_func: InputTypeFunc, param_choices: ChoicesType) -> _t.Optional[TypeFunc]:
@@ -54,7 +56,7 @@ def normalize_input_type(type_func: InputTypeFunc, param_choices: ChoicesType) -
         return Choices(param_choices) if choices_provided else type_func
     elif isinstance(type_func, range):
         return Range(type_func)
-    elif isinstance(type_func, _t.Pattern):
+    elif isinstance(type_func, _Pattern):
         return Regex(type_func)
 
     try:
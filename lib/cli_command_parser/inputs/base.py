@@ -4,7 +4,6 @@ Custom input handlers for Parameters
 :author: Doug Skrypa
 """
 
-from abc import ABC, abstractmethod
 from typing import Any, Generic, Optional
 
 from ..typing import Bool, T
@@ -12,13 +11,14 @@ from ..typing import Bool, T
 __all__ = ['InputType']
 
 
-class InputType(Generic[T], ABC):
+class InputType(Generic[T]):
+    # Note: This is intentionally not an ABC - isinstance checks against this class happen while parsing arguments, and
+    # they are significantly slower when the target class uses ABCMeta.
     __slots__ = ('_fix_default',)
 
     def __init__(self, fix_default: Bool = True):
         self._fix_default = fix_default
 
-    @abstractmethod
     def __call__(self, value: str) -> T:
         """Process the parsed argument and convert it to the desired type"""
         raise NotImplementedError
@@ -42,6 +42,10 @@ class _ChoicesBase(InputType[T], ABC):
         cls_name = self.__class__.__name__
         return f'<{cls_name}[{self._type_str()}case_sensitive={self.case_sensitive}, choices=({self._choices_repr()})]>'
 
+    @abstractmethod
+    def __call__(self, value: str) -> T:
+        raise NotImplementedError
+
     @abstractmethod
     def _choices_repr(self, delim: str = ',') -> str:
         raise NotImplementedError
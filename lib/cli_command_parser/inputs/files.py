@@ -7,19 +7,34 @@ Custom file / path input handlers for Parameters
 from __future__ import annotations
 
 import os
-from abc import ABC
+from abc import ABC, abstractmethod
+from errno import EBADF, ELOOP, ENOENT, ENOTDIR
+from json import JSONDecodeError, dump as json_dump, load as json_load, loads as json_loads
 from pathlib import Path as _Path
 from typing import Optional, Union
 
 from ..typing import FP, Bool, Converter, PathLike, T
+from ..utils import _NotSet
 from .base import InputType
 from .exceptions import InputValidationError
 from .utils import FileWrapper, InputParam, StatMode, allows_write, fix_windows_path
 
 __all__ = ['Path', 'File', 'Serialized', 'Json', 'Pickle']
 
+# The same errors that are treated as "does not exist" by Path.exists / Path.is_dir / etc
+_MISSING_PATH_ERRNOS = (ENOENT, ENOTDIR, EBADF, ELOOP)
+_MISSING_PATH_WINERRORS = (21, 123, 1921)  # ERROR_NOT_READY, ERROR_INVALID_NAME, ERROR_CANT_RESOLVE_FILENAME
+# Translation table that replaces every digit with 0 and everything else with a space, used to find runs of digits much
+# faster than an equivalent regex search
+_DIGITS_TO_ZERO_BYTES = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+# orjson is only imported when json is first read, since importing it adds noticeable overhead to CLI startup
+_orjson_loads = _NotSet
+
 
 class FileInput(InputType[T], ABC):
+    __slots__ = ('_exists', '_expand', '_resolve', '_type', '_readable', '_writable', '_allow_dash', '_use_windows_fix')
+    _repr_attrs: tuple[str, ...] = ()
+    _repr_exclude: tuple[str, ...] = ()
     exists: bool = InputParam(None)
     expand: bool = InputParam(True)
     resolve: bool = InputParam(False)
@@ -46,16 +61,29 @@ class FileInput(InputType[T], ABC):
         self.exists = exists
         self.expand = expand
         self.resolve = resolve
-        self.type = StatMode(type)  # pylint: disable=E1120
+        self.type = type if isinstance(type, StatMode) else StatMode(type)  # pylint: disable=E1120
         self.readable = readable
         self.writable = writable
         self.allow_dash = allow_dash
         self.use_windows_fix = use_windows_fix
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The names of all InputParams, in definition order, are collected once here instead of in every __repr__ call
+        names = {}
+        for klass in reversed(cls.__mro__):
+            names.update((k, None) for k, v in klass.__dict__.items() if isinstance(v, InputParam))
+        cls._repr_attrs = tuple(name for name in names if name not in cls._repr_exclude)
+
     def __repr__(self) -> str:
-        non_defaults = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items())
+        attrs = ((k, getattr(self, f'_{k}', _NotSet)) for k in self._repr_attrs)
+        non_defaults = ', '.join(f'{k}={v!r}' for k, v in attrs if v is not _NotSet)
         return f'<{self.__class__.__name__}({non_defaults})>'
 
+    @abstractmethod
+    def __call__(self, value: str) -> T:
+        raise NotImplementedError
+
     def fix_default(self, value: Optional[T]) -> Optional[T]:
         """
         Fixes the default value to conform to the expected return type for this input.  Allows the default value for a
@@ -69,12 +97,12 @@ class FileInput(InputType[T], ABC):
         if not isinstance(path, _Path):
             if not (path := path.strip()):
                 raise InputValidationError('A valid path is required')
+            elif path == '-':  # Skip constructing a Path and parsing its parts for the most common dash case
+                return self._validated_dash()
             path = _Path(path)
         if path.parts == ('-',):
-            if not self.allow_dash:
-                raise InputValidationError('Dash (-) is not supported for this parameter')
-            return path
-        if self.use_windows_fix and os.name == 'nt':
+            return self._validated_dash()
+        if os.name == 'nt' and self.use_windows_fix:  # The platform check is cheaper than the InputParam lookup
             try:
                 path = fix_windows_path(path)
             except OSError:
@@ -82,16 +110,31 @@ class FileInput(InputType[T], ABC):
         if self.expand:
             path = path.expanduser()
         if self.resolve:
+            # Note: this can't be short-circuited for absolute paths - any component may be a symlink, not just the last
             path = path.resolve()
-        if self.exists is not None:
-            if self.exists and not path.exists():
-                raise InputValidationError('the provided path does not exist')
-            elif not self.exists and path.exists():
-                raise InputValidationError('the provided path already exists')
-
-        if self.type != StatMode.ANY and path.exists() and not self.type.matches(path.stat().st_mode):
-            # TODO: Indicate what the discovered type was
-            raise InputValidationError(f'expected a {self.type}')
+        # Each InputParam access is a descriptor call, so the values that are used more than once are only read once
+        exists, stat_mode = self.exists, self.type
+        check_type = stat_mode != StatMode.ANY
+        if exists is not None or check_type:
+            # A single stat call provides both the existence and type info
+            try:
+                st_mode = path.stat().st_mode
+            except OSError as e:
+                if e.errno not in _MISSING_PATH_ERRNOS and getattr(e, 'winerror', None) not in _MISSING_PATH_WINERRORS:
+                    raise
+                st_mode = None
+            except ValueError:  # The path contained a null byte
+                st_mode = None
+
+            if exists is not None:
+                if exists and st_mode is None:
+                    raise InputValidationError('the provided path does not exist')
+                elif not exists and st_mode is not None:
+                    raise InputValidationError('the provided path already exists')
+
+            if check_type and st_mode is not None and not stat_mode.matches(st_mode):
+                # TODO: Indicate what the discovered type was
+                raise InputValidationError(f'expected a {stat_mode}')
 
         if self.readable and not os.access(path, os.R_OK):
             raise InputValidationError('the provided path is not readable')
@@ -99,6 +142,11 @@ class FileInput(InputType[T], ABC):
             raise InputValidationError('the provided path is not writable')
         return path
 
+    def _validated_dash(self) -> _Path:
+        if not self.allow_dash:
+            raise InputValidationError('Dash (-) is not supported for this parameter')
+        return _Path('-')
+
 
 class Path(FileInput[_Path]):
     # noinspection PyUnresolvedReferences
@@ -118,6 +166,8 @@ class Path(FileInput[_Path]):
     :param fix_default: Whether default values should be normalized using :meth:`~FileInput.fix_default`.
     """
 
+    __slots__ = ()
+
     def __call__(self, value: PathLike) -> _Path:
         return self.validated_path(value)
 
@@ -133,6 +183,7 @@ class File(FileInput[Union[FileWrapper, str, bytes]]):
     :param kwargs: Additional keyword arguments to pass to :class:`.Path`.
     """
 
+    __slots__ = ('_mode', '_encoding', '_errors', '_lazy', '_parents')
     mode: str = InputParam('r')
     type: StatMode = InputParam(StatMode.FILE)
     encoding: str = InputParam(None)
@@ -150,9 +201,10 @@ class File(FileInput[Union[FileWrapper, str, bytes]]):
         parents: Bool = False,
         **kwargs,
     ):
-        if not lazy and allows_write(mode):
-            raise ValueError(f'Cannot combine {mode=} with lazy=False for {self.__class__.__name__}')
-        if not allows_write(mode):
+        if allows_write(mode):
+            if not lazy:
+                raise ValueError(f'Cannot combine {mode=} with lazy=False for {self.__class__.__name__}')
+        else:
             kwargs.setdefault('exists', True)
         kwargs.setdefault('type', StatMode.FILE)
         super().__init__(**kwargs)
@@ -183,6 +235,9 @@ class Serialized(File):
     :param kwargs: Additional keyword arguments to pass to :class:`.File`
     """
 
+    __slots__ = ('_converter', '_pass_file')
+    # `converter` must be excluded to prevent infinite recursion when an instance method is stored in that attr
+    _repr_exclude = ('converter',)
     converter: Converter = InputParam(None)
     pass_file: bool = InputParam(False)
 
@@ -191,33 +246,40 @@ class Serialized(File):
         self.converter = converter
         self.pass_file = pass_file
 
-    def __repr__(self) -> str:
-        non_defaults = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items() if k != 'converter')
-        # `converter` must be excluded to prevent infinite recursion when an instance method is stored in that attr
-        return f'<{self.__class__.__name__}({non_defaults})>'
-
     def _prep_file_wrapper(self, path: _Path) -> FileWrapper:
         return FileWrapper(path, self.mode, self.encoding, self.errors, self.converter, self.pass_file, self.parents)
 
 
 class Json(Serialized):
     """
+    If the optional `orjson <https://github.com/ijl/orjson>`__ dependency is installed, then it will be used to parse
+    json content when reading.  The standard library's :mod:`python:json` module is used otherwise, for writing, and
+    for any content that orjson rejects, so the same content is accepted either way.
+
     :param kwargs: Additional keyword arguments to pass to :class:`.File`
     """
 
-    def __init__(self, *, mode: str = 'rb', wrap_errors: bool = True, **kwargs):
-        import json
+    __slots__ = ('_wrap_errors',)
+    wrap_errors: bool = InputParam(True)
 
+    def __init__(self, *, mode: str = 'rb', wrap_errors: bool = True, **kwargs):
         write = allows_write(mode, True)
         kwargs['pass_file'] = True
-        super().__init__(json.dump if write else self._load_json, mode=mode, **kwargs)
+        super().__init__(json_dump if write else self._load_json, mode=mode, **kwargs)
         self.wrap_errors = wrap_errors
 
     def _load_json(self, f: FP):
-        from json import JSONDecodeError, load
-
         try:
-            return load(f)
+            if (orjson_loads := _get_orjson_loads()) is None:
+                return json_load(f)
+            content = f.read()
+            if not _may_contain_big_int(content):
+                try:
+                    return orjson_loads(content)
+                except JSONDecodeError:  # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+                    pass  # orjson rejects some content that the stdlib accepts (such as NaN or a UTF-8 BOM)
+            # The stdlib is used to determine whether the content is valid, so orjson never changes what is accepted
+            return json_loads(content)
         except JSONDecodeError as e:
             if self.wrap_errors:
                 if name := getattr(f, 'name', None):
@@ -229,11 +291,35 @@ class Json(Serialized):
                 raise
 
 
+def _get_orjson_loads():
+    global _orjson_loads
+    if _orjson_loads is _NotSet:
+        try:
+            from orjson import loads as _orjson_loads
+        except ImportError:
+            _orjson_loads = None
+    return _orjson_loads
+
+
+def _may_contain_big_int(content: Union[str, bytes]) -> bool:
+    """
+    orjson silently converts ints that do not fit in 64 bits to floats, so content that may contain one needs to be
+    parsed by the stdlib instead.  Any run of 19+ digits is treated as a potential big int (false positives, such as
+    long strings of digits or floats with many digits, only cost speed).
+    """
+    if isinstance(content, str):
+        # str.translate is very slow for non-ASCII text; multi-byte UTF-8 sequences never contain ASCII digit bytes
+        content = content.encode('utf-8', 'surrogatepass')
+    return b'0' * 19 in content.translate(_DIGITS_TO_ZERO_BYTES)
+
+
 class Pickle(Serialized):
     """
     :param kwargs: Additional keyword arguments to pass to :class:`.File`
     """
 
+    __slots__ = ()
+
     def __init__(self, *, mode: str = 'rb', **kwargs):
         import pickle
 
@@ -39,6 +39,10 @@ class NumericInput(InputType[NT], ABC):
             return False
         return True
 
+    @abstractmethod
+    def __call__(self, value: str) -> NT:
+        raise NotImplementedError
+
     @abstractmethod
     def _range_str(self, var: str = 'N') -> str:
         raise NotImplementedError
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import os
 import re
-from abc import ABC
+from abc import ABC, abstractmethod
 from enum import Enum
 from fnmatch import translate
 from typing import Collection, Dict, Match, Pattern, Sequence, Tuple, TypeVar, Union
@@ -26,6 +26,10 @@ class PatternInput(InputType[T], ABC):
     __slots__ = ('patterns',)
     patterns: tuple[Pattern, ...]
 
+    @abstractmethod
+    def __call__(self, value: str) -> T:
+        raise NotImplementedError
+
     def _pattern_strings(self, sort: bool = False) -> Sequence[str]:
         patterns = [p.pattern for p in self.patterns]
         if sort:
@@ -89,6 +89,10 @@ class DTInput(InputType[T], ABC):
         super().__init__(fix_default)
         self.locale = locale
 
+    @abstractmethod
+    def __call__(self, value: str) -> T:
+        raise NotImplementedError
+
     @abstractmethod
     def choice_str(self, choice_delim: str = ',', sort_choices: bool = False) -> str:
         raise NotImplementedError
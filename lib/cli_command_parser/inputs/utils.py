@@ -9,6 +9,7 @@ from __future__ import annotations
 import sys
 import warnings
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from stat import S_IFBLK, S_IFCHR, S_IFDIR, S_IFIFO, S_IFLNK, S_IFMT, S_IFREG, S_IFSOCK
 from typing import TYPE_CHECKING, Any, BinaryIO, ContextManager, TextIO, Union
@@ -24,25 +25,30 @@ __all__ = ['InputParam', 'StatMode', 'FileWrapper', 'fix_windows_path', 'range_s
 
 
 class InputParam:
-    __slots__ = ('default', 'name')
+    """
+    Descriptor for input attributes that only stores non-default values.  Values are stored in a slot with the same
+    name, prefixed with ``_``, which must be declared in the ``__slots__`` of the class that uses this descriptor.
+    """
+
+    __slots__ = ('default', 'name', 'slot')
 
     def __init__(self, default: Any):
         self.default = default
 
     def __set_name__(self, owner, name: str):
         self.name = name
+        self.slot = f'_{name}'
 
     def __get__(self, instance, owner) -> Any:
-        try:
-            return instance.__dict__[self.name]
-        except AttributeError:  # instance is None
+        if instance is None:
             return self
-        except KeyError:
-            return self.default
+        # The slot is only set for non-default values.  Letting getattr handle the fallback avoids raising/catching an
+        # AttributeError in Python for every default value access.
+        return getattr(instance, self.slot, self.default)
 
     def __set__(self, instance, value: Any):
         if value != self.default:
-            instance.__dict__[self.name] = value
+            setattr(instance, self.slot, value)
 
 
 class StatMode(FixedFlag):
@@ -68,8 +74,7 @@ class StatMode(FixedFlag):
     ANY = None, 'any'
 
     def matches(self, mode: int) -> bool:
-        mode = S_IFMT(mode)
-        return any(mode == part.mode for part in self._decompose())
+        return S_IFMT(mode) in _stat_mode_types(self)
 
     def __str__(self) -> str:
         try:
@@ -85,6 +90,12 @@ class StatMode(FixedFlag):
         return ', '.join(names)
 
 
+@lru_cache(maxsize=None)
+def _stat_mode_types(stat_mode: StatMode) -> frozenset[int]:
+    # The set of possible members is small and fixed, so the decomposed file types for each are only computed once
+    return frozenset(part.mode for part in stat_mode._decompose())
+
+
 class FileWrapper:
     def __init__(
         self,
@@ -131,7 +142,7 @@ class FileWrapper:
             else:
                 f.write(data)
 
-    def _open(self) -> FP:
+    def _open(self, track: bool = True) -> FP:
         if self.path == Path('-'):
             stream = sys.stdin if 'r' in self.mode else sys.stdout
             return stream.buffer if self.binary else stream
@@ -144,7 +155,8 @@ class FileWrapper:
         except OSError as e:
             raise InputValidationError(f'Unable to open {self.path} - {e}') from e
         else:
-            self._finalizer = finalize(self, self._cleanup, fp, f'Implicitly cleaning up {self.path}')
+            if track:
+                self._finalizer = finalize(self, self._cleanup, fp, f'Implicitly cleaning up {self.path}')
             return fp
 
     @classmethod
@@ -170,10 +182,11 @@ class FileWrapper:
 
     @contextmanager
     def _file(self) -> ContextManager[FP]:
+        # The file is always closed on exit here, so there's no need to register a finalizer for it
         try:
-            yield self._open()
+            yield self._open(False)
         finally:
-            self.close()
+            self._close()
 
     def __enter__(self) -> Union[FP, FileWrapper]:
         if self.converter is not None:
@@ -184,6 +197,7 @@ class FileWrapper:
         self.close()
 
 
+@lru_cache(maxsize=32)  # There are very few distinct valid modes
 def allows_write(mode: str, strict: bool = False) -> bool:
     chars = 'wxa' if strict else 'wxa+'
     return any(c in mode for c in chars)
@@ -8,13 +8,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NoReturn, Sequence, TypeVar, Union
 
-from ..context import ctx
+from ..context import ctx, get_current_context
 from ..exceptions import BadArgument, InvalidChoice, MissingArgument, ParamConflict, ParamUsageError, TooManyArguments
 from ..inputs import InputType
 from ..nargs import Nargs
 from ..utils import _NotSet, camel_to_snake_case
 
 if TYPE_CHECKING:
+    from ..context import Context
     from ..typing import Bool, CommandObj, Param, T_co
 
 __all__ = [
@@ -164,18 +165,20 @@ class ValueMixin:
     get_default: Callable
 
     def set_value(self, value):
-        if (prev := ctx.get_parsed_value(self.param)) is not _NotSet:
+        context = get_current_context()  # Avoid resolving the active context through the ctx proxy more than once
+        if (prev := context.get_parsed_value(self.param)) is not _NotSet:
             raise ParamUsageError(
                 self.param, f'can only be specified once - found multiple values: {prev!r}, {value!r}'
             )
 
-        ctx.set_parsed_value(self.param, value)
+        context.set_parsed_value(self.param, value)
 
     def append_value(self, value):
-        parsed = ctx.get_parsed_value(self.param)
+        context = get_current_context()
+        parsed = context.get_parsed_value(self.param)
         if parsed is _NotSet:
             parsed = self.get_default()
-            ctx.set_parsed_value(self.param, parsed)
+            context.set_parsed_value(self.param, parsed)
         elif self.param.nargs.max_reached(parsed):
             raise TooManyArguments(self.param, f'already found {len(parsed)} values')
 
@@ -202,18 +205,22 @@ class ConstMixin:
         super().__init_subclass__(**kwargs)
         cls._append = append
 
-    def set_const(self, const):
-        parsed = ctx.get_parsed_value(self.param)
+    def set_const(self, const, context: Context = None):
+        if context is None:
+            context = get_current_context()
+        parsed = context.get_parsed_value(self.param)
         if parsed is not _NotSet and parsed != const:
             raise ParamConflict([self.param])
 
-        ctx.set_parsed_value(self.param, const)
+        context.set_parsed_value(self.param, const)
 
-    def append_const(self, const):
-        parsed = ctx.get_parsed_value(self.param)
+    def append_const(self, const, context: Context = None):
+        if context is None:
+            context = get_current_context()
+        parsed = context.get_parsed_value(self.param)
         if parsed is _NotSet:
             parsed = self.get_default()
-            ctx.set_parsed_value(self.param, parsed)
+            context.set_parsed_value(self.param, parsed)
 
         parsed.append(const)
 
@@ -231,11 +238,12 @@ class ConstMixin:
         # if const is _NotSet:  # It does not support storing constants
         #     return self.add_value(value)
         if use_value:  # Due to config or Param type (TriFlag needs this even when invoking the positive action)
-            ctx.record_action(self.param)
+            context = get_current_context()
+            context.record_action(self.param)
             if self._append:
-                self.append_const(const)
+                self.append_const(const, context)
             else:
-                self.set_const(const)
+                self.set_const(const, context)
             return 1
         elif const:
             return self.add_const()
@@ -405,8 +413,10 @@ class StoreConst(BasicConstAction, default=None):
     # region Add Parsed Value / Constant Methods
 
     def add_const(self, *, opt: str = None, combo: bool = False) -> Found:
-        ctx.record_action(self.param)
-        self.set_const(self.param.get_const(opt))
+        # This is the path taken for every Flag / TriFlag provided via CLI, so the context is only resolved once
+        context = get_current_context()
+        context.record_action(self.param)
+        self.set_const(self.param.get_const(opt), context)
         return 1
 
     # endregion
@@ -418,9 +428,10 @@ class AppendConst(BasicConstAction, append=True):
     # region Add Parsed Value / Constant Methods
 
     def add_const(self, *, opt: str = None, combo: bool = False) -> Found:
-        ctx.record_action(self.param)
+        context = get_current_context()
+        context.record_action(self.param)
         # TODO: Fix nargs consistency for overall vs per-arg
-        self.append_const(self.param.get_const(opt))
+        self.append_const(self.param.get_const(opt), context)
         return 1
 
     # endregion
@@ -458,11 +469,12 @@ class Count(ParamAction, accepts_values=True, accepts_consts=True):
     default_nargs = Nargs('?')
 
     def _add(self, value: int):
-        parsed = ctx.get_parsed_value(self.param)
+        context = get_current_context()
+        parsed = context.get_parsed_value(self.param)
         if parsed is _NotSet:
             parsed = self.param.init
 
-        ctx.set_parsed_value(self.param, parsed + value)
+        context.set_parsed_value(self.param, parsed + value)
 
     # region Add Parsed Value / Constant Methods
 
@@ -493,14 +505,15 @@ class Concatenate(Append):
             ctx.record_action(param)
             raise InvalidChoice(param, value, param.choices)
 
-        parsed = ctx.get_parsed_value(param)
+        context = get_current_context()
+        parsed = context.get_parsed_value(param)
         if parsed is _NotSet:
-            ctx.set_parsed_value(param, values)
+            context.set_parsed_value(param, values)
         else:
             parsed.extend(values)
 
         n_values = len(values)
-        ctx.record_action(param, n_values)
+        context.record_action(param, n_values)
         return n_values
 
     # endregion
@@ -527,15 +540,19 @@ class StoreAll(Store):
 
     def add_values(self, values: list[str], *, combo: bool = False) -> Found:
         param = self.param
-        ctx.record_action(param)
+        context = get_current_context()
+        context.record_action(param)
 
-        if (value := ctx.get_parsed_value(param)) is not _NotSet:
+        if (value := context.get_parsed_value(param)) is not _NotSet:
             raise ParamUsageError(
                 param, f'can only be specified once - found {values=} but a stored {value=} already exists'
             )
 
-        values = [param.prepare_value(v) for v in values]
-        ctx.set_parsed_value(param, values)
+        if param.type is None:  # prepare_value would return each value unchanged
+            values = list(values)
+        else:
+            values = [param.prepare_value(v) for v in values]
+        context.set_parsed_value(param, values)
         return len(values)
 
     # endregion
@@ -55,6 +55,7 @@ class ParamBase(ABC):
     # Instance Attributes
     _attr_name: str = None          #: Always the name of the attr that points to this object
     _name: str = None               #: An explicitly provided name, or the name of the attr that points to this object
+    _auto_name: str = None          #: The cached default name to use if this object was never named
     group: ParamGroup = None        #: The group this object is a member of, if any
     command: CommandCls = None      #: The :class:`.Command` this object is a member of
     required: Bool                  #: Whether this param/group is required
@@ -78,7 +79,10 @@ class ParamBase(ABC):
     def name(self) -> str:
         if self._name is not None:
             return self._name
-        return self._default_name()
+        elif (auto_name := self._auto_name) is None:
+            # Params added after Command class creation never get a name assigned, but this is accessed during parsing
+            self._auto_name = auto_name = self._default_name()
+        return auto_name
 
     @name.setter
     def name(self, value: Union[str, None]):
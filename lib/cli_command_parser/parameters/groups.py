@@ -9,7 +9,7 @@ from __future__ import annotations
 from itertools import count
 from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
-from ..context import ctx
+from ..context import ctx, get_current_context
 from ..exceptions import CommandDefinitionError, ParamConflict, ParameterDefinitionError, ParamsMissing
 from .base import BaseOption, BasePositional, ParamBase, _group_stack
 from .pass_thru import PassThru
@@ -73,9 +73,10 @@ class ParamGroup(ParamBase):
         self.description = description
         # TODO: Description from docstring just inside with block?  Is it possible?
         self.members = []
-        if mutually_dependent and mutually_exclusive:
-            name = self.name or 'Options'
-            raise ParameterDefinitionError(f'group={name!r} cannot be both mutually_exclusive and mutually_dependent')
+        if mutually_exclusive and mutually_dependent:
+            raise ParameterDefinitionError(
+                f'group={self.name or "Options"!r} cannot be both mutually_exclusive and mutually_dependent'
+            )
         self.mutually_exclusive = mutually_exclusive
         self.mutually_dependent = mutually_dependent
 
@@ -123,7 +124,7 @@ class ParamGroup(ParamBase):
         return param in self.members
 
     def __iter__(self) -> Iterator[ParamOrGroup]:
-        yield from self.members
+        return iter(self.members)
 
     # endregion
 
@@ -183,8 +184,9 @@ class ParamGroup(ParamBase):
         """Called after parsing to group this group's members by whether they were provided or not."""
         provided = []
         missing = []
+        num_provided = get_current_context().num_provided  # Avoid resolving the active context for every member
         for obj in self.members:
-            if ctx.num_provided(obj):
+            if num_provided(obj):
                 provided.append(obj)
             else:
                 missing.append(obj)
@@ -212,10 +214,10 @@ class ParamGroup(ParamBase):
         # log.debug(f'{self}: Checking group conflicts in {provided=}, {missing=}')
         # log.debug(f'{self}: Checking group conflicts in provided={len(provided)}, missing={len(missing)}')
         if self.mutually_dependent and provided and missing:
-            p_str = ', '.join(p.format_usage(full=True, delim='/') for p in provided)
+            p_str = ', '.join([p.format_usage(full=True, delim='/') for p in provided])
             be = 'was' if len(provided) == 1 else 'were'
             raise ParamsMissing(missing, f'because {p_str} {be} provided')
-        elif self.mutually_exclusive and not 0 <= len(provided) < 2:
+        elif self.mutually_exclusive and len(provided) > 1:
             raise ParamConflict(provided, 'they are mutually exclusive - only one is allowed')
 
     @property
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
-from functools import partial, update_wrapper
+from functools import update_wrapper
+from types import MethodType
 from typing import TYPE_CHECKING, Any, Callable, Literal, NoReturn, Optional, TypeVar, Union
 
 from ..exceptions import BadArgument, CommandDefinitionError, ParameterDefinitionError, ParamUsageError, ParserExit
@@ -41,6 +42,8 @@ TC = TypeVar('TC')
 TA = TypeVar('TA')
 ConstAct = Literal['store_const', 'append_const']
 
+_FLAG_DEFAULT_CONST_MAP = {True: False, False: True, _NotSet: True}
+
 
 class Option(BaseOption[Union[T_co, TD]], actions=(Store, Append)):
     """
@@ -152,7 +155,6 @@ class Flag(BaseOption[Union[TD, TC]], actions=(StoreConst, AppendConst)):
     nargs = Nargs(0)
     type = staticmethod(str_to_bool)  # Without staticmethod, this would be interpreted as a normal method
     use_env_value: bool = False
-    __default_const_map = {True: False, False: True, _NotSet: True}
     default: TD
     const: TC
 
@@ -168,7 +170,7 @@ class Flag(BaseOption[Union[TD, TC]], actions=(StoreConst, AppendConst)):
     ):
         if const is _NotSet:
             try:
-                const = self.__default_const_map[default]
+                const = _FLAG_DEFAULT_CONST_MAP[default]
             except KeyError as e:
                 raise ParameterDefinitionError(
                     f"A 'const' value is required for {self.__class__.__name__} since {default=} is not True or False"
@@ -177,7 +179,7 @@ class Flag(BaseOption[Union[TD, TC]], actions=(StoreConst, AppendConst)):
             cls_name = self.__class__.__name__
             raise ParameterDefinitionError(f"The 'default_cb' arg is not supported for {cls_name} parameters")
         if default is _NotSet:
-            default = self.__default_const_map.get(const, _NotSet)  # will be True or False
+            default = _FLAG_DEFAULT_CONST_MAP.get(const, _NotSet)  # will be True or False
         if default is False:  # Avoid surprises for custom non-truthy values
             kwargs.setdefault('show_default', False)
         super().__init__(*option_strs, action=action, default=default, **kwargs)
@@ -242,6 +244,7 @@ class TriFlag(BaseOption[Union[TD, TC, TA]], ABC, actions=(StoreConst, AppendCon
     alt_help: OptStr = None
     default: TD
     consts: tuple[TC, TA]
+    _alt_consts: Optional[dict[str, TA]] = None
 
     def __init__(
         self,
@@ -280,7 +283,7 @@ class TriFlag(BaseOption[Union[TD, TC, TA]], ABC, actions=(StoreConst, AppendCon
                 f'Invalid {default=} with {consts=} - the default must not match either value'
             )
 
-        alt_opt_strs = (opt for opt in (alt_short, alt_long) if opt)
+        alt_opt_strs = tuple(filter(None, (alt_short, alt_long)))
         super().__init__(*option_strs, *alt_opt_strs, action=action, default=default, default_cb=default_cb, **kwargs)
         self.consts = consts
         self.option_strs.add_alts(alt_prefix, alt_long, alt_short)
@@ -292,6 +295,8 @@ class TriFlag(BaseOption[Union[TD, TC, TA]], ABC, actions=(StoreConst, AppendCon
     def __set_name__(self, command: CommandCls, name: str):
         super().__set_name__(command, name)
         self.option_strs.update_alts(name)
+        # The alt option strings are final once the name is known, so the per-store lookup can be a single dict.get
+        self._alt_consts = dict.fromkeys(self.option_strs.alt_allowed, self.consts[1])
 
     def register_default_cb(self, method: CommandMethod) -> CommandMethod:
         if self._default_cb_ok and self.default is not _NotSet:
@@ -299,7 +304,9 @@ class TriFlag(BaseOption[Union[TD, TC, TA]], ABC, actions=(StoreConst, AppendCon
         return super().register_default_cb(method)
 
     def get_const(self, opt_str: OptStr = None) -> Union[TC, TA]:
-        if opt_str in self.option_strs.alt_allowed:
+        if (alt_consts := self._alt_consts) is not None:
+            return alt_consts.get(opt_str, self.consts[0])
+        elif opt_str in self.option_strs.alt_allowed:
             return self.consts[1]
         else:
             return self.consts[0]
@@ -339,6 +346,10 @@ class ActionFlag(Flag, repr_attrs=('order', 'before_main')):
     :param kwargs: Additional keyword arguments to pass to :class:`.Flag`.
     """
 
+    _func: Optional[Callable] = None
+    _hash: Optional[int] = None
+    _sort_key: Optional[tuple[bool, Union[int, float], str]] = None
+
     def __init__(
         self,
         *option_strs: str,
@@ -354,7 +365,8 @@ class ActionFlag(Flag, repr_attrs=('order', 'before_main')):
         elif always_available and not before_main:
             raise ParameterDefinitionError('always_available=True cannot be combined with before_main=False')
         super().__init__(*option_strs, **kwargs)
-        self.func = func
+        if func is not None:  # When used as a decorator, func is set via __call__ instead
+            self.func = func
         self.order = order
         self.before_main = before_main
         self.always_available = always_available
@@ -366,6 +378,7 @@ class ActionFlag(Flag, repr_attrs=('order', 'before_main')):
     @func.setter
     def func(self, func: Optional[Callable]):
         self._func = func
+        self._hash = self._sort_key = None
         if func is not None:
             if self.help is None:
                 try:
@@ -374,22 +387,33 @@ class ActionFlag(Flag, repr_attrs=('order', 'before_main')):
                     pass
             update_wrapper(self, func)
 
+    def __set_name__(self, command: CommandCls, name: str):
+        super().__set_name__(command, name)
+        self._hash = self._sort_key = None
+
     def __hash__(self) -> int:
-        result = hash(self.__class__)
-        for attr in (self.name, self.command, self.func, self.order, self.before_main):
-            result ^= hash(attr)
-        return result
+        # ActionFlags are used as keys for parsed values, so this is computed once and only reset when one of these
+        # attributes is changed (by assigning this to a Command attribute, or by using this as a decorator)
+        if self._hash is None:
+            self._hash = hash((self.__class__, self.name, self.command, self._func, self.order, self.before_main))
+        return self._hash
 
     def __eq__(self, other: ActionFlag) -> bool:
         if not isinstance(other, ActionFlag):
             return NotImplemented
-        return all(getattr(self, a) == getattr(other, a) for a in ('name', 'func', 'command', 'order', 'before_main'))
+        own_attrs = (self.name, self._func, self.command, self.order, self.before_main)
+        return own_attrs == (other.name, other._func, other.command, other.order, other.before_main)
 
     def __lt__(self, other: ActionFlag) -> bool:
         if not isinstance(other, ActionFlag):
             return NotImplemented
-        # noinspection PyTypeChecker
-        return (not self.before_main, self.order, self.name) < (not other.before_main, other.order, other.name)
+        return self._get_sort_key() < other._get_sort_key()
+
+    def _get_sort_key(self) -> tuple[bool, Union[int, float], str]:
+        # Like the hash, this is reset when the name may have changed
+        if self._sort_key is None:
+            self._sort_key = (not self.before_main, self.order, self.name)
+        return self._sort_key
 
     def __call__(self, func: Callable) -> ActionFlag:
         """
@@ -408,7 +432,7 @@ class ActionFlag(Flag, repr_attrs=('order', 'before_main')):
         if command is None:
             return self
         # Note: If func is None, then CommandParameters._process_action_flags raises ParameterDefinitionError
-        return partial(self.func, command)  # imitates a bound method
+        return MethodType(self._func, command)
 
 
 #: Alias for :class:`ActionFlag`
@@ -496,7 +520,7 @@ class Counter(BaseOption[int], actions=(Count,)):
             return self.type(value)
         except (ValueError, TypeError) as e:
             combinable = self.option_strs.combinable
-            if short_combo and combinable and all(c in combinable for c in value):
+            if short_combo and combinable and combinable.issuperset(value):
                 return len(value) + 1  # +1 for the -short that preceded this value
             suffix = f' from env var={env_var!r}' if env_var else ''
             raise BadArgument(self, f'bad counter {value=}{suffix}') from e
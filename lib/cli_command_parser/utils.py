@@ -6,6 +6,7 @@ Utilities for working with terminals, strings, and Enums.
 
 from __future__ import annotations
 
+import re
 from enum import EnumMeta, Flag
 from inspect import isawaitable
 from shutil import get_terminal_size
@@ -25,11 +26,14 @@ except ImportError:
 FlagEnum = TypeVar('FlagEnum', bound='FixedFlag')
 T = TypeVar('T')
 _NotSet = object()
+_CAMEL_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
 
 # region Text Processing / Formatting
 
 
 def camel_to_snake_case(text: str, delim: str = '_') -> str:
+    if text.isascii():  # The regex can only identify ASCII upper case chars; str.isupper is used for anything else
+        return delim.join(_CAMEL_BOUNDARY.split(text)).lower()
     return ''.join(f'{delim}{c}' if i and c.isupper() else c for i, c in enumerate(text)).lower()
 
 
@@ -16,6 +16,14 @@ class MiscTest(ParserTest):
 
         self.assertEqual('this counts for coverage...?  ._.', 'this counts for coverage...?  ._.')
 
+    def test_lazy_get_formatter(self):
+        import cli_command_parser
+        from cli_command_parser.formatting.commands import get_formatter
+
+        self.assertIs(get_formatter, cli_command_parser.get_formatter)
+        with self.assertRaises(AttributeError):
+            cli_command_parser.foo  # noqa
+
     def test_assert_strings_equal(self):
         with self.assertRaises(AssertionError):
             self.assert_strings_equal('foo', 'bar')
@@ -16,6 +16,10 @@ class UtilsTest(ParserTest):
         self.assertEqual('foo_bar', camel_to_snake_case('FooBar'))
         self.assertEqual('foo bar', camel_to_snake_case('FooBar', ' '))
         self.assertEqual('foo', camel_to_snake_case('Foo'))
+        self.assertEqual('h_t_t_p_server', camel_to_snake_case('HTTPServer'))
+        self.assertEqual('foo-bar', camel_to_snake_case('fooBar', '-'))
+        self.assertEqual('caf\xe9_bar', camel_to_snake_case('Caf\xe9Bar'))
+        self.assertEqual('x_\xe9y', camel_to_snake_case('x\xc9y'))
 
     def test_terminal_width_refresh(self):
         with patch('cli_command_parser.utils.get_terminal_size', return_value=(123, 1)):
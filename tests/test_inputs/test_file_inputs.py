@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import json
+import math
 import os
 import pickle
 from contextlib import contextmanager
@@ -15,6 +16,7 @@ from cli_command_parser import Command, Option, Positional
 from cli_command_parser.exceptions import BadArgument
 from cli_command_parser.inputs import File, Json, Path as PathInput, Pickle, Serialized, StatMode
 from cli_command_parser.inputs.exceptions import InputValidationError
+from cli_command_parser.inputs.files import FileInput
 from cli_command_parser.inputs.utils import FileWrapper, InputParam, fix_windows_path
 from cli_command_parser.testing import ParserTest, RedirectStreams
 
@@ -100,14 +102,35 @@ class FileInputTest(TestCase):
 
     # endregion
 
+    def test_abstract_base_not_instantiable(self):
+        with self.assertRaisesRegex(TypeError, "Can't instantiate abstract class FileInput"):
+            FileInput()  # noqa
+
+    def test_subclass_without_call_not_instantiable(self):
+        class Foo(FileInput):
+            pass
+
+        with self.assertRaisesRegex(TypeError, "Can't instantiate abstract class Foo"):
+            Foo()  # noqa
+
     def test_input_param_on_cls(self):
         self.assertIsInstance(PathInput.exists, InputParam)
 
+    def test_input_param_non_default_stored_in_slot(self):
+        path = PathInput(exists=True)
+        self.assertFalse(hasattr(path, '__dict__'))
+        self.assertTrue(path._exists)
+        self.assertFalse(hasattr(path, '_expand'))
+        self.assertTrue(path.expand)
+
     def test_path_reprs(self):
         self.assertEqual('<Path()>', repr(PathInput()))
         self.assertEqual('<Path(exists=True)>', repr(PathInput(exists=True)))
         self.assertEqual('<Path(exists=True, type=<StatMode:DIR>)>', repr(PathInput(exists=True, type='dir')))
         self.assertEqual('<File(exists=True)>', repr(File(exists=True)))
+        self.assertEqual('<Serialized(exists=True, lazy=False)>', repr(Serialized(json.loads, lazy=False)))
+        expected = "<Json(exists=True, mode='rb', pass_file=True, wrap_errors=False)>"
+        self.assertEqual(expected, repr(Json(wrap_errors=False)))
 
     def test_path_resolve(self):
         with temp_path('a', True) as a, temp_chdir(a.parent):
@@ -143,6 +166,28 @@ class FileInputTest(TestCase):
             self.assertEqual(a, pi(a.as_posix()))
             self.assertEqual(b, pi(b.as_posix()))
 
+    def test_path_stat_called_once(self):
+        with temp_path('a', True) as a:
+            with patch.object(Path, 'stat', autospec=True, side_effect=Path.stat) as stat_mock:
+                self.assertEqual(a, PathInput(exists=True, type=StatMode.FILE)(a.as_posix()))
+
+        stat_mock.assert_called_once()
+
+    def test_symlink_loop_does_not_exist(self):
+        with temp_path('loop') as loop:
+            try:
+                loop.symlink_to(loop)
+            except OSError as e:  # Symlinks may require elevated privileges on Windows
+                self.skipTest(f'Unable to create a symlink: {e}')
+
+            self.assertEqual(loop, PathInput(exists=False)(loop.as_posix()))
+            with self.assertRaisesRegex(InputValidationError, 'the provided path does not exist'):
+                PathInput(exists=True)(loop.as_posix())
+
+    def test_null_byte_does_not_exist(self):
+        with self.assertRaisesRegex(InputValidationError, 'the provided path does not exist'):
+            PathInput(exists=True)('a\0b')
+
     def test_empty_arg_rejected(self):
         with self.assertRaises(ValueError):
             PathInput()('')
@@ -159,6 +204,13 @@ class FileInputTest(TestCase):
     def test_dash_allowed(self):
         self.assertEqual(Path('-'), PathInput(allow_dash=True)('-'))
 
+    def test_dash_variants(self):
+        for case in (' - ', './-', Path('-')):
+            with self.subTest(case=case):
+                self.assertEqual(Path('-'), PathInput(allow_dash=True)(case))
+                with self.assertRaises(ValueError):
+                    PathInput()(case)
+
     def test_not_writable_rejected(self):
         with temp_path('a', True) as a:
             a.chmod(0o000)
@@ -365,6 +417,14 @@ class ReadFileTest(ParserTest):
             a.write_text('test')
             self.assertEqual('test', File(lazy=False)(a.as_posix()))
 
+    def test_read_does_not_register_finalizer(self):
+        with temp_path('a') as a, patch(f'{PKG}.utils.finalize') as finalize_mock:
+            a.write_text('test')
+            self.assertEqual('test', File(lazy=False)(a.as_posix()))
+            self.assertEqual('test', File()(a.as_posix()).read())
+
+        finalize_mock.assert_not_called()
+
     def test_command_read_text(self):
         class Foo(Command):
             bar = Positional(type=File(lazy=False))
@@ -406,6 +466,43 @@ class ReadJsonTest(ParserTest):
             with RedirectStreams('{"a": 1, "b": 2]'):
                 Json(allow_dash=True, lazy=False, mode='r')('-')
 
+    def test_json_read_uses_orjson_when_available(self):
+        loads_mock = Mock(return_value={'a': 1})
+        with temp_path('a') as a, patch(f'{MODULE}._orjson_loads', loads_mock):
+            a.write_text('{"a": 1}')
+            self.assertEqual({'a': 1}, Json(lazy=False)(a.as_posix()))
+
+        loads_mock.assert_called_once_with(b'{"a": 1}')
+
+    def test_json_read_with_orjson_accepts_stdlib_content(self):
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            self.skipTest('orjson is not installed')
+
+        big_int = 123456789012345678901234567890
+        with temp_path('a') as a:
+            for content, expected in ((f'{{"a": {big_int}}}', big_int), ('\ufeff{"a": 1}', 1)):
+                with self.subTest(content=content):
+                    a.write_text(content, encoding='utf-8')
+                    self.assertEqual({'a': expected}, Json(lazy=False)(a.as_posix()))
+
+            with self.subTest(content='NaN'):
+                a.write_text('{"a": NaN}')
+                self.assertTrue(math.isnan(Json(lazy=False)(a.as_posix())['a']))
+
+    def test_json_read_text_non_ascii(self):
+        big_int = 123456789012345678901234567890
+        cases = [
+            ('{"a": "\u00e9\u4e2d\U0001f600", "b": 12}', {'a': '\u00e9\u4e2d\U0001f600', 'b': 12}),
+            (f'{{"\u00e9": {big_int}}}', {'\u00e9': big_int}),
+        ]
+        with temp_path('a') as a:
+            for content, expected in cases:
+                with self.subTest(content=content):
+                    a.write_text(content, encoding='utf-8')
+                    self.assertEqual(expected, Json(lazy=False, mode='r', encoding='utf-8')(a.as_posix()))
+
     def test_read_invalid_json(self):
         expected_error = r"json from file='.+?' - are you sure it contains properly formatted json\?"
         with temp_path() as tmp_path:
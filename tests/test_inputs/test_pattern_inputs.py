@@ -7,6 +7,7 @@ from unittest import main
 from cli_command_parser import Command, Option
 from cli_command_parser.exceptions import ParameterDefinitionError
 from cli_command_parser.inputs import Regex, RegexMode, Glob, InputValidationError
+from cli_command_parser.inputs.patterns import PatternInput
 from cli_command_parser.testing import ParserTest
 
 PAT = re.compile('foo')
@@ -96,6 +97,10 @@ class RegexInputTest(ParserTest):
         self.assertEqual('bar | foo', r.format_metavar(sort_choices=True))
         self.assertEqual('foo | bar', r.format_metavar())
 
+    def test_abstract_base_not_instantiable(self):
+        with self.assertRaisesRegex(TypeError, "Can't instantiate abstract class PatternInput"):
+            PatternInput()  # noqa
+
 
 class GlobInputTest(ParserTest):
     def test_pattern_with_choices_rejected(self):
@@ -238,6 +238,30 @@ class ActionFlagTest(ParserTest):
         self.assertEqual(help_action, help_action)
         self.assertNotEqual(help_action, '')
 
+    def test_hash_reset_on_func_and_name_assignment(self):
+        af = ActionFlag()
+        initial = hash(af)
+        self.assertEqual(initial, hash(af))
+        af(Mock(__doc__=''))
+        with_func = hash(af)
+        self.assertNotEqual(initial, with_func)
+
+        class Foo(Command):
+            bar = af
+
+        self.assertNotEqual(with_func, hash(af))
+        self.assertEqual(hash(af), hash(Foo.bar))
+
+    def test_sort_key_reset_on_name_assignment(self):
+        a, b = ActionFlag(), ActionFlag()
+        self.assertIsInstance(a < b, bool)  # The default names are assigned before __set_name__ is called
+
+        class Foo(Command):
+            zed = a(Mock(__doc__=''))
+            abc = b(Mock(__doc__=''))
+
+        self.assertEqual([b, a], sorted([a, b]))
+
     def test_dunder_get(self):
         mock = Mock()
 
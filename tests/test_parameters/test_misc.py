@@ -80,6 +80,21 @@ class MiscParameterTest(ParserTest):
             with self.subTest(param_cls=param_cls):
                 self.assertIs(expected_cls, ParamHelpFormatter.for_param_cls(param_cls))
 
+    def test_formatter_class_for_unregistered_subclass(self):
+        class CustomOption(Option):
+            pass
+
+        self.assertIs(OptionHelpFormatter, ParamHelpFormatter.for_param_cls(CustomOption))
+
+        # Cleanups run in LIFO order, so the cache is cleared after the registration is removed
+        self.addCleanup(ParamHelpFormatter._inherited_fmt_cls_cache.clear)
+        self.addCleanup(ParamHelpFormatter._param_cls_fmt_cls_map.pop, CustomOption)
+
+        class CustomOptionHelpFormatter(OptionHelpFormatter, param_cls=CustomOption):
+            pass
+
+        self.assertIs(CustomOptionHelpFormatter, ParamHelpFormatter.for_param_cls(CustomOption))
+
     def test_short_conflict(self):
         class Foo(Command):
             bar = Flag('-b')
@@ -140,17 +155,18 @@ class UnlikelyToBeReachedParameterTest(ParserTest):
                 action.add_value('foo')
 
     def test_sort_mixed_types(self):
+        group, flag, action_flag = ParamGroup(), Flag(), ActionFlag()  # Sorting does not modify them
         sort_cases = [
-            (ParamGroup(), Flag(), ActionFlag()),
-            (Flag(), ActionFlag(), ParamGroup()),
-            (ActionFlag(), ParamGroup(), Flag()),
-            ('foo', ParamGroup(), Flag(), ActionFlag()),
-            ('foo', Flag(), ActionFlag(), ParamGroup()),
-            ('foo', ActionFlag(), ParamGroup(), Flag()),
+            (group, flag, action_flag),
+            (flag, action_flag, group),
+            (action_flag, group, flag),
+            ('foo', group, flag, action_flag),
+            ('foo', flag, action_flag, group),
+            ('foo', action_flag, group, flag),
         ]
-        for group in sort_cases:
-            with self.subTest(group=group), self.assertRaises(TypeError):
-                sorted(group)
+        for case in sort_cases:
+            with self.subTest(case=case), self.assertRaises(TypeError):
+                sorted(case)
 
     def test_none_valid(self):
         with Context():